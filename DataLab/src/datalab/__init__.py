@@ -34,16 +34,79 @@ New in this version:
 # Package metadata
 __version__ = '0.2.0'
 
-# Import key functions for easy access
+import importlib
+
+# Key functions available directly from the package
 # This allows users to do: from datalab import log, analyze_csv_data
 # instead of: from datalab.utils import log; from datalab.processing import analyze_csv_data
-from datalab.utils import log
-from datalab.utils.formatting import format_number, format_currency, format_percentage
-from datalab.analysis.processing import analyze_json_data, analyze_csv_data
-from datalab.analysis.statistics import calculate_average, calculate_sum, count_by_field
-from datalab.io.module_io import load_json, save_json, load_csv, save_csv
-from datalab.output.reports import create_analysis_report, save_report_to_file, generate_timestamp
-from datalab import config
+#
+# They are imported lazily (PEP 562 module __getattr__), so importing
+# datalab (or only format_number) doesn't load csv/json/pathlib and the
+# whole I/O and analysis stack up front.
+_LAZY_IMPORTS = {
+    # Utils - Logging
+    'log': 'datalab.utils',
+    # Utils - Formatting
+    'format_number': 'datalab.utils.formatting',
+    'format_currency': 'datalab.utils.formatting',
+    'format_percentage': 'datalab.utils.formatting',
+    # Processing
+    'analyze_json_data': 'datalab.analysis.processing',
+    'analyze_csv_data': 'datalab.analysis.processing',
+    # I/O
+    'load_json': 'datalab.io.module_io',
+    'save_json': 'datalab.io.module_io',
+    'iter_csv': 'datalab.io.module_io',
+    'load_csv': 'datalab.io.module_io',
+    'save_csv': 'datalab.io.module_io',
+    # Statistics
+    'calculate_average': 'datalab.analysis.statistics',
+    'calculate_sum': 'datalab.analysis.statistics',
+    'count_by_field': 'datalab.analysis.statistics',
+    # Reports
+    'create_analysis_report': 'datalab.output.reports',
+    'save_report_to_file': 'datalab.output.reports',
+    'generate_timestamp': 'datalab.output.reports',
+    # Config (a submodule, exported as the module itself)
+    'config': 'datalab.config',
+}
+
+
+def __getattr__(name):
+    """
+    Import a public name on first access and cache it in the package.
+
+    Subpackages and submodules (datalab.utils, datalab.io, ...) are also
+    imported on access, as the eager imports used to bind them.
+
+    Args:
+        name: Attribute being looked up
+
+    Returns:
+        The imported function or module
+
+    Raises:
+        AttributeError: If name isn't part of the public API or a submodule
+    """
+    if name not in _LAZY_IMPORTS:
+        try:
+            # Importing a submodule also binds it as a package attribute
+            return importlib.import_module(f'{__name__}.{name}')
+        except ModuleNotFoundError as e:
+            if e.name != f'{__name__}.{name}':
+                raise  # The submodule exists but one of its imports is missing
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_LAZY_IMPORTS[name])
+    value = module if module.__name__ == f'{__name__}.{name}' else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List lazily imported names alongside the regular module attributes."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 # Define what gets exported with "from datalab import *"
 # (Though explicit imports are preferred!)
@@ -60,6 +123,7 @@ __all__ = [
     # I/O
     'load_json',
     'save_json',
+    'iter_csv',
     'load_csv',
     'save_csv',
     # Statistics
@@ -6,19 +6,57 @@ Demonstrates:
 - Using centralized config
 - Composing functions from other modules
 - Working with different data formats
+- Columnar analysis with pandas (when installed)
+- JIT-compiled numeric reductions with Numba (when installed)
+- Caching results with functools.lru_cache
 """
 
+import functools
+import math
+import os
+
 from datalab import config
-from datalab.io.module_io import load_json, load_csv
-from datalab.analysis.statistics import calculate_average, count_by_field, get_min_max
+from datalab.io.module_io import load_json, iter_csv
+from datalab.analysis.statistics import calculate_average
 from datalab.utils import log
 from datalab.utils.formatting import format_number
 
+# CSV files at least this large are analyzed column-wise with pandas (bytes).
+# Below it, importing pandas costs more than the whole streaming pass.
+_COLUMNAR_THRESHOLD = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=32)
+def _summarize_json(filepath, mtime_ns, size):
+    """
+    Load and summarize a JSON file (cached).
+
+    The modification time and size are part of the cache key, so
+    editing the file invalidates the cached result automatically (the
+    size catches rewrites within the filesystem's timestamp granularity).
+
+    Args:
+        filepath: Path to JSON file (as str)
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+
+    Returns:
+        Dictionary with record count and statistics
+    """
+    data = load_json(filepath)
+
+    return {
+        'records': len(data),
+        'average_age': calculate_average(data, 'age'),
+    }
+
 
 def analyze_json_data(filename=None):
     """
     Load and analyze JSON data.
 
+    Repeated calls on an unchanged file reuse the cached result.
+
     Args:
         filename: JSON filename (uses default if None)
 
@@ -27,51 +65,244 @@ def analyze_json_data(filename=None):
     """
     if filename is None:
         filename = config.DEFAULT_JSON_FILE
+        filepath = config.DEFAULT_JSON_PATH
+    else:
+        filepath = config.get_data_path(filename)
+    stat_info = os.stat(filepath)
+    summary = _summarize_json(str(filepath), stat_info.st_mtime_ns, stat_info.st_size)
 
-    filepath = config.get_data_path(filename)
-    data = load_json(filepath)
+    return {'file': filename, **summary}
+
+
+def _reduce_columns(age, salary):
+    """
+    Reduce the numeric CSV columns to their summary statistics.
+
+    With Numba installed this is compiled to machine code on first use
+    (cached on disk) - see _column_reducer().
+
+    Args:
+        age: NumPy array of ages
+        salary: NumPy array of salaries
+
+    Returns:
+        Tuple of (average_age, average_salary, min_salary, max_salary)
+    """
+    # cumsum adds left to right like the streaming pass, so the averages
+    # match it bit for bit (mean() uses pairwise summation)
+    records = len(age)
+    return (age.cumsum()[-1] / records, salary.cumsum()[-1] / records,
+            salary.min(), salary.max())
+
+
+@functools.cache
+def _column_reducer():
+    """
+    Get the column reducer, JIT-compiling it with Numba if installed.
+
+    Numba is imported here rather than at module load, since it is a
+    slow import and only large, columnar CSV analysis uses it.
+    fastmath is left off: it would let the sums be reordered.
+
+    Returns:
+        _reduce_columns, compiled with numba.njit when available
+    """
+    try:
+        from numba import njit
+    except ImportError:  # Numba is optional - NumPy's reductions are used instead
+        return _reduce_columns
+    return njit(cache=True)(_reduce_columns)
+
+
+@functools.cache
+def _import_pandas():
+    """
+    Import pandas on first use.
+
+    Keeps pandas (a slow import) off the module import path.
+
+    Returns:
+        The pandas module, or None if it isn't installed
+    """
+    try:
+        import pandas
+    except ImportError:  # pandas is optional - fall back to the streaming pass
+        return None
+    return pandas
+
+
+def _summarize_csv_columns(filepath, pd):
+    """
+    Compute CSV statistics with pandas (columnar, parsed in C).
+
+    Only the needed columns are read, straight into typed arrays, so
+    each statistic is one vectorized call. Values are parsed like the
+    streaming pass does (no NA conversion, round-trip float parsing),
+    and cities are counted in order of first appearance.
 
-    avg_age = calculate_average(data, 'age')
+    Anything pandas can't parse, data containing NaN, and empty cities
+    that may come from short rows are left to the streaming pass, so
+    both paths always give the same result or error.
+
+    Args:
+        filepath: Path to CSV file
+        pd: The pandas module
+
+    Returns:
+        Dictionary with record count and statistics, or None to defer
+        to _summarize_records()
+    """
+    try:
+        df = pd.read_csv(
+            filepath,
+            usecols=['age', 'salary', 'city'],
+            dtype={'age': 'float64', 'salary': 'float64', 'city': 'object'},
+            keep_default_na=False,
+            float_precision='round_trip',
+            index_col=False,  # Drop extra fields, like DictReader, rather than shift columns
+        )
+    except ValueError:
+        # Missing columns, empty values, numbers only float() accepts...
+        return None
+
+    if df.empty:
+        return None
+
+    avg_age, avg_salary, min_salary, max_salary = _column_reducer()(
+        df['age'].to_numpy(), df['salary'].to_numpy()
+    )
+    if math.isnan(avg_age) or math.isnan(avg_salary):
+        return None
+
+    if (df['city'] == '').any():
+        # A row that ends before the city reads as '' here but None in
+        # DictReader. Numbers missing the same way already failed to
+        # parse, so this is only ambiguous when city comes after both.
+        header = pd.read_csv(filepath, nrows=0, index_col=False).columns.tolist()
+        if header.index('city') > max(header.index('age'), header.index('salary')):
+            return None
+
+    city_counts = df['city'].value_counts(sort=False, dropna=False)
 
     return {
-        'file': filename,
-        'records': len(data),
-        'average_age': avg_age,
+        'records': len(df),
+        'average_age': float(avg_age),
+        'average_salary': float(avg_salary),
+        'city_distribution': {city: int(count) for city, count in city_counts.items()},
+        'salary_range': (float(min_salary), float(max_salary)),
     }
 
 
-def analyze_csv_data(filename=None):
+def _summarize_records(records):
     """
-    Load and analyze CSV data.
+    Compute CSV statistics in one fused pass over the records (pure Python).
 
-    Demonstrates working with CSV files and performing
-    multiple statistical analyses.
+    Each row's fields are looked up and converted once, and every
+    accumulator is updated in the same loop - instead of one full pass
+    (and one float() per row) for each statistic. Works on any iterable
+    of dictionaries, including the streaming iter_csv() generator.
 
     Args:
-        filename: CSV filename (uses default if None)
+        records: Iterable of dictionaries with 'age', 'salary' and 'city'
 
     Returns:
-        Dictionary with analysis results
+        Dictionary with record count and statistics
     """
-    if filename is None:
-        filename = config.DEFAULT_CSV_FILE
+    records_count = 0
+    age_total = 0.0
+    salary_total = 0.0
+    min_salary = float('inf')
+    max_salary = float('-inf')
+    city_counts = {}
+    get_count = city_counts.get
 
-    filepath = config.get_data_path(filename)
-    data = load_csv(filepath)
+    for row in records:
+        # One try per field, so the error names the field that's wrong
+        try:
+            age = float(row['age'])
+        except KeyError:
+            raise ValueError("Field 'age' not found in data")
+        except (ValueError, TypeError):
+            raise ValueError("Field 'age' contains non-numeric data")
 
-    # Perform various analyses
-    avg_age = calculate_average(data, 'age')
-    avg_salary = calculate_average(data, 'salary')
-    city_distribution = count_by_field(data, 'city')
-    min_salary, max_salary = get_min_max(data, 'salary')
+        try:
+            salary = float(row['salary'])
+        except KeyError:
+            raise ValueError("Field 'salary' not found in data")
+        except (ValueError, TypeError):
+            raise ValueError("Field 'salary' contains non-numeric data")
+
+        records_count += 1
+        age_total += age
+        salary_total += salary
+        if salary < min_salary:
+            min_salary = salary
+        if salary > max_salary:
+            max_salary = salary
+        city = row.get('city')
+        city_counts[city] = get_count(city, 0) + 1
+
+    if records_count == 0:
+        raise ValueError("Cannot analyze empty dataset")
 
     return {
-        'file': filename,
-        'records': len(data),
-        'average_age': avg_age,
-        'average_salary': avg_salary,
-        'city_distribution': city_distribution,
+        'records': records_count,
+        'average_age': age_total / records_count,
+        'average_salary': salary_total / records_count,
+        'city_distribution': city_counts,
         'salary_range': (min_salary, max_salary),
     }
 
 
+@functools.lru_cache(maxsize=32)
+def _summarize_csv(filepath, mtime_ns, size):
+    """
+    Summarize a CSV file (cached).
+
+    The modification time and size are part of the cache key, so
+    editing the file invalidates the cached result automatically (the
+    size catches rewrites within the filesystem's timestamp granularity).
+
+    Args:
+        filepath: Path to CSV file (as str)
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+
+    Returns:
+        Dictionary with record count and statistics
+    """
+    pd = _import_pandas() if size >= _COLUMNAR_THRESHOLD else None
+    if pd is not None:
+        summary = _summarize_csv_columns(filepath, pd)
+        if summary is not None:
+            return summary
+    return _summarize_records(iter_csv(filepath))
+
+
+def analyze_csv_data(filename=None):
+    """
+    Load and analyze CSV data.
+
+    Demonstrates working with CSV files and performing
+    multiple statistical analyses. Large files use pandas' columnar
+    reader when available, otherwise a single streaming pass over the rows.
+    Repeated calls on an unchanged file reuse the cached result.
+
+    Args:
+        filename: CSV filename (uses default if None)
+
+    Returns:
+        Dictionary with analysis results
+    """
+    if filename is None:
+        filename = config.DEFAULT_CSV_FILE
+        filepath = config.DEFAULT_CSV_PATH
+    else:
+        filepath = config.get_data_path(filename)
+    stat_info = os.stat(filepath)
+    summary = _summarize_csv(str(filepath), stat_info.st_mtime_ns, stat_info.st_size)
+
+    result = {'file': filename, **summary}
+    # Copy the nested dict so callers can't modify the cached result
+    result['city_distribution'] = dict(summary['city_distribution'])
+    return result
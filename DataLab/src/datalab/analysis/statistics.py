@@ -6,9 +6,63 @@ Demonstrates:
 - Type conversion and data validation
 - Reusable statistical functions
 - Using collections.Counter from standard library
+- Vectorized reductions with NumPy (when installed)
 """
 
+import functools
 from collections import Counter
+from operator import methodcaller
+
+# Datasets with at least this many records are reduced with NumPy.
+# Below it, importing NumPy costs more than the pure-Python reductions.
+_VECTORIZE_THRESHOLD = 10_000
+
+
+@functools.cache
+def _import_numpy():
+    """
+    Import NumPy on first use.
+
+    Keeps NumPy (a slow import) off the module import path.
+
+    Returns:
+        The numpy module, or None if it isn't installed
+    """
+    try:
+        import numpy
+    except ImportError:  # NumPy is optional - fall back to plain Python
+        return None
+    return numpy
+
+
+def _column(data, field):
+    """
+    Extract a numeric field from every record.
+
+    For large datasets with NumPy installed, the values are packed into
+    one contiguous float64 array, so sum/mean/min/max run as C loops
+    instead of Python-level iteration. Otherwise (small datasets,
+    iterators of unknown length, no NumPy) a plain list is returned.
+
+    Arrays are summed with cumsum() rather than sum()/mean(): it adds
+    left to right like sum() on the list, so results don't change with
+    dataset size (NumPy's sum()/mean() use pairwise summation).
+
+    Args:
+        data: List of dictionaries (or any iterable of them)
+        field: Field name to extract
+
+    Returns:
+        numpy.ndarray of float64, or list of floats
+    """
+    values = (float(record[field]) for record in data)
+    if not hasattr(data, '__len__') or len(data) < _VECTORIZE_THRESHOLD:
+        return list(values)
+
+    np = _import_numpy()
+    if np is None:
+        return list(values)
+    return np.fromiter(values, dtype=np.float64, count=len(data))
 
 
 def calculate_average(data, field):
@@ -28,17 +82,19 @@ def calculate_average(data, field):
     if not data:
         raise ValueError("Cannot calculate average of empty dataset")
 
-    values = []
-    for record in data:
-        if field not in record:
-            raise ValueError(f"Field '{field}' not found in data")
+    try:
+        values = _column(data, field)
+    except KeyError:
+        raise ValueError(f"Field '{field}' not found in data")
+    except (ValueError, TypeError):
+        raise ValueError(f"Field '{field}' contains non-numeric data")
 
-        try:
-            values.append(float(record[field]))
-        except (ValueError, TypeError):
-            raise ValueError(f"Field '{field}' contains non-numeric data")
+    if len(values) == 0:
+        raise ValueError("Cannot calculate average of empty dataset")
 
-    return sum(values) / len(values)
+    if isinstance(values, list):
+        return sum(values) / len(values)
+    return float(values.cumsum()[-1]) / len(values)
 
 
 def calculate_sum(data, field):
@@ -55,8 +111,10 @@ def calculate_sum(data, field):
     if not data:
         return 0.0
 
-    values = [float(record[field]) for record in data]
-    return sum(values)
+    values = _column(data, field)
+    if isinstance(values, list):
+        return sum(values)
+    return float(values.cumsum()[-1])
 
 
 def count_by_field(data, field):
@@ -74,8 +132,9 @@ def count_by_field(data, field):
     Returns:
         Dictionary mapping values to counts
     """
-    # Extract values from field
-    values = [record.get(field) for record in data]
+    # Extract values from field - methodcaller is implemented in C, so
+    # no Python-level frame runs per record (missing fields count as None)
+    values = map(methodcaller('get', field), data)
 
     # Counter makes counting easy!
     # Old way: counts = {}; for v in values: counts[v] = counts.get(v, 0) + 1
@@ -97,5 +156,10 @@ def get_min_max(data, field):
     if not data:
         raise ValueError("Cannot find min/max of empty dataset")
 
-    values = [float(record[field]) for record in data]
-    return min(values), max(values)
+    values = _column(data, field)
+    if len(values) == 0:
+        raise ValueError("Cannot find min/max of empty dataset")
+
+    if isinstance(values, list):
+        return min(values), max(values)
+    return float(values.min()), float(values.max())
@@ -5,6 +5,7 @@ This module centralizes all configuration, paths, and constants.
 Demonstrates proper path handling using __file__ and pathlib.
 """
 
+from functools import cache
 from pathlib import Path
 
 # === PATH CONFIGURATION ===
@@ -17,17 +18,23 @@ DATA_DIR = PROJECT_ROOT / 'data'  # Data directory in project root
 DEFAULT_JSON_FILE = 'data.json'
 DEFAULT_CSV_FILE = 'people.csv'
 
+# Full paths to the default files, resolved once at import
+DEFAULT_JSON_PATH = DATA_DIR / DEFAULT_JSON_FILE
+DEFAULT_CSV_PATH = DATA_DIR / DEFAULT_CSV_FILE
+
 # === APPLICATION SETTINGS ===
 LOG_PREFIX = '[DataLab]'
 DECIMAL_PLACES = 2
 
 
+@cache
 def get_data_path(filename):
     """
     Get full path to a data file.
 
     This ensures we always reference data files correctly,
-    regardless of the current working directory.
+    regardless of the current working directory. Results are
+    cached, since the same filename always gives the same Path.
 
     Args:
         filename: Name of file in data directory
@@ -47,8 +54,8 @@ def main():
     print(f"Project root:       {PROJECT_ROOT}")
     print(f"Data directory:     {DATA_DIR}")
     print(f"\nDefault files:")
-    print(f"  JSON: {get_data_path(DEFAULT_JSON_FILE)}")
-    print(f"  CSV:  {get_data_path(DEFAULT_CSV_FILE)}")
+    print(f"  JSON: {DEFAULT_JSON_PATH}")
+    print(f"  CSV:  {DEFAULT_CSV_PATH}")
     print(f"\nSettings:")
     print(f"  Log prefix:       {LOG_PREFIX}")
     print(f"  Decimal places:   {DECIMAL_PLACES}")
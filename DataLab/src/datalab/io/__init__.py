@@ -10,7 +10,7 @@ Demonstrates:
 - Clean separation of I/O concerns
 """
 
-from datalab.io.module_io import load_json, save_json, load_csv, save_csv
+from datalab.io.module_io import load_json, save_json, iter_csv, load_csv, save_csv
 from datalab.io.file_ops import (
     list_directory_contents,
     copy_file,
@@ -26,6 +26,7 @@ __all__ = [
     # JSON/CSV operations
     'load_json',
     'save_json',
+    'iter_csv',
     'load_csv',
     'save_csv',
     # File operations
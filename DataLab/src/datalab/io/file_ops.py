@@ -3,27 +3,39 @@ File operations module for DataLab.
 
 Demonstrates:
 - os module for operating system interactions
+- stat module for interpreting file metadata
 - shutil module for high-level file operations
 - pathlib module (modern path handling - already used in config)
-- glob module for pattern matching
+- fnmatch module for pattern matching
 - File and directory management
 """
 
+import datetime
 import os
+import stat
 import shutil
-import glob
+import fnmatch
+import sys
 from pathlib import Path
 from datalab import config
 from datalab.utils import log
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# ioctl request number for FICLONE (from <linux/fs.h>)
+_FICLONE = 0x40049409
+
 
 def list_directory_contents(directory=None):
     """
     List contents of a directory.
 
     Demonstrates:
-    - os.listdir() to list files
-    - os.path operations
+    - os.scandir() to list files
+    - Using cached DirEntry type information
     - Distinguishing files from directories
 
     Args:
@@ -35,22 +47,21 @@ def list_directory_contents(directory=None):
     if directory is None:
         directory = config.DATA_DIR
 
-    directory = Path(directory)
-
-    if not directory.exists():
-        log(f"Directory does not exist: {directory}")
-        return {'files': [], 'directories': []}
-
     files = []
     directories = []
 
-    # Using os.listdir
-    for item in os.listdir(directory):
-        full_path = directory / item
-        if full_path.is_file():
-            files.append(item)
-        elif full_path.is_dir():
-            directories.append(item)
+    # Using os.scandir - each DirEntry already knows its type from the
+    # directory listing, so is_file()/is_dir() usually need no extra stat
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    files.append(entry.name)
+                elif entry.is_dir():
+                    directories.append(entry.name)
+    except (FileNotFoundError, NotADirectoryError):
+        log(f"Directory does not exist: {directory}")
+        return {'files': [], 'directories': []}
 
     return {
         'files': sorted(files),
@@ -63,9 +74,8 @@ def get_file_info(filepath):
     Get detailed information about a file.
 
     Demonstrates:
-    - os.path.getsize() for file size
-    - os.path.getmtime() for modification time
-    - os.path.exists() for checking existence
+    - os.stat() for size, modification time and file type in one call
+    - stat module for interpreting st_mode
     - Converting timestamps to readable dates
 
     Args:
@@ -74,24 +84,22 @@ def get_file_info(filepath):
     Returns:
         Dictionary with file information
     """
-    import datetime
-
     filepath = Path(filepath)
 
-    if not filepath.exists():
+    # One stat call answers everything below (exists, size, mtime, type)
+    try:
+        stat_info = os.stat(filepath)
+    except (FileNotFoundError, NotADirectoryError):
         return {'exists': False}
 
-    # Get file stats
-    stat_info = filepath.stat()
-
     return {
         'exists': True,
         'name': filepath.name,
         'size_bytes': stat_info.st_size,
         'size_kb': stat_info.st_size / 1024,
         'modified': datetime.datetime.fromtimestamp(stat_info.st_mtime),
-        'is_file': filepath.is_file(),
-        'is_directory': filepath.is_dir(),
+        'is_file': stat.S_ISREG(stat_info.st_mode),
+        'is_directory': stat.S_ISDIR(stat_info.st_mode),
         'extension': filepath.suffix,
     }
 
@@ -101,8 +109,9 @@ def find_files_by_pattern(pattern, directory=None):
     Find files matching a glob pattern.
 
     Demonstrates:
-    - glob module for pattern matching
+    - fnmatch module for pattern matching
     - Working with wildcards (*, **, ?)
+    - os.scandir() so files are recognised without an extra stat
 
     Args:
         pattern: Glob pattern (e.g., '*.json', '**/*.csv')
@@ -119,24 +128,110 @@ def find_files_by_pattern(pattern, directory=None):
         directory = config.DATA_DIR
 
     directory = Path(directory)
+
+    # Simple patterns like '*.json': one directory listing, no re-stat
+    if '/' not in pattern and '**' not in pattern:
+        try:
+            with os.scandir(directory) as entries:
+                return [str(directory / entry.name) for entry in entries
+                        if entry.is_file() and fnmatch.fnmatch(entry.name, pattern)]
+        except OSError:
+            return []
+
+    # Recursive patterns like '**/*.csv': match file names in the whole tree
+    if pattern.startswith('**/') and '/' not in pattern[3:] and '**' not in pattern[3:]:
+        name_pattern = pattern[3:]
+        # Rebuild each path from directory, so it reads like a glob() result
+        prefix_len = len(os.path.join(directory, ''))
+        return [str(directory / entry.path[prefix_len:]) for entry in _scan_files(directory)
+                if fnmatch.fnmatch(entry.name, name_pattern) and entry.is_file()]
+
+    # Anything more complex: let pathlib handle it
     matches = list(directory.glob(pattern))
 
     # Return only files, not directories
     return [str(f) for f in matches if f.is_file()]
 
 
+def _reflink(source, destination):
+    """
+    Try to clone a file with the Linux FICLONE ioctl.
+
+    On copy-on-write filesystems (btrfs, XFS with reflink) the clone
+    shares the source's data blocks, so it is instant regardless of size.
+
+    Args:
+        source: Source file path
+        destination: Destination file path
+
+    Returns:
+        True if the clone succeeded, False if it isn't supported here
+    """
+    if fcntl is None or not sys.platform.startswith('linux'):
+        return False
+
+    # Only clone regular file onto regular file (or a new file). Anything
+    # else - FIFOs, devices, the same file twice, a missing source - is
+    # left to shutil.copyfile(), which raises the proper error instead of
+    # blocking in open() on a pipe.
+    try:
+        source_stat = os.stat(source)
+    except OSError:
+        return False
+    if not stat.S_ISREG(source_stat.st_mode):
+        return False
+
+    try:
+        destination_stat = os.stat(destination)
+    except FileNotFoundError:
+        pass  # Destination doesn't exist yet
+    except OSError:
+        return False
+    else:
+        if not stat.S_ISREG(destination_stat.st_mode):
+            return False
+        if os.path.samestat(source_stat, destination_stat):
+            return False
+
+    with open(source, 'rb') as src:
+        with open(destination, 'wb') as dst:
+            try:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+            except OSError:
+                return False
+    return True
+
+
+def _copy_with_metadata(source, destination):
+    """
+    Copy file contents and metadata (same result as shutil.copy2).
+
+    Tries a reflink first; otherwise shutil.copyfile() copies the data
+    (using the kernel's in-kernel copy fast paths where available).
+    Permissions and timestamps are then copied with shutil.copystat().
+
+    Args:
+        source: Source file path
+        destination: Destination file path
+    """
+    if not _reflink(source, destination):
+        shutil.copyfile(source, destination)
+    shutil.copystat(source, destination)
+
+
 def copy_file(source, destination, create_backup=True):
     """
     Copy a file to a new location.
 
     Demonstrates:
-    - shutil.copy2() for copying files with metadata
+    - shutil.copyfile() + shutil.copystat() for copying files with metadata
+    - Reflink (copy-on-write) clones on Linux when the filesystem supports it
     - Creating backup copies
     - Path handling
 
     Args:
         source: Source file path
-        destination: Destination file path
+        destination: Destination file or directory path
         create_backup: If True and destination exists, create backup first
 
     Returns:
@@ -145,24 +240,33 @@ def copy_file(source, destination, create_backup=True):
     source = Path(source)
     destination = Path(destination)
 
-    if not source.exists():
-        raise FileNotFoundError(f"Source file not found: {source}")
+    # Copying into a directory keeps the source's name (as shutil.copy2 does)
+    if destination.is_dir():
+        destination = destination / source.name
 
     # Create backup if destination exists
-    if destination.exists() and create_backup:
-        import datetime
+    if create_backup and destination.exists():
+        # Don't leave a backup behind for a copy that can't happen
+        if not source.exists():
+            raise FileNotFoundError(f"Source file not found: {source}")
+
         timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_path = destination.parent / f"{destination.stem}_backup_{timestamp}{destination.suffix}"
         try:
-            shutil.copy2(destination, backup_path)
+            _copy_with_metadata(destination, backup_path)
             log(f"Created backup: {backup_path}")
         except (OSError, PermissionError) as e:
             raise IOError(f"Failed to create backup: {e}")
 
     # Copy file with metadata (timestamps, permissions)
+    # No exists() check first - opening the source reports a missing file
     try:
-        shutil.copy2(source, destination)
+        _copy_with_metadata(source, destination)
         log(f"Copied {source.name} to {destination}")
+    except FileNotFoundError as e:
+        if e.filename == os.fspath(source):
+            raise FileNotFoundError(f"Source file not found: {source}") from None
+        raise IOError(f"Failed to copy file: {e}")
     except (OSError, PermissionError) as e:
         raise IOError(f"Failed to copy file: {e}")
 
@@ -185,10 +289,10 @@ def create_backup(file_path, backup_dir=None):
     Returns:
         Path to backup file
     """
-    import datetime
-
     file_path = Path(file_path)
 
+    # Check before creating the backup directory, so a missing file
+    # doesn't leave an empty directory behind
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
@@ -208,22 +312,57 @@ def create_backup(file_path, backup_dir=None):
     backup_name = f"{file_path.stem}_backup_{timestamp}{file_path.suffix}"
     backup_path = backup_dir / backup_name
 
-    # Copy file
+    # Copy file (a source removed since the check is reported the same way)
     try:
-        shutil.copy2(file_path, backup_path)
+        _copy_with_metadata(file_path, backup_path)
         log(f"Backup created: {backup_path}")
+    except FileNotFoundError as e:
+        if e.filename == os.fspath(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+        raise IOError(f"Failed to create backup: {e}")
     except (OSError, PermissionError) as e:
         raise IOError(f"Failed to create backup: {e}")
 
     return backup_path
 
 
+def _scan_files(directory):
+    """
+    Recursively yield DirEntry objects for all non-directories in a tree.
+
+    Each directory's files come before its subdirectories' (the order
+    Path.glob('**/...') uses). Symlinked directories are not followed
+    (same as os.walk's default). Directories that can't be read are skipped.
+
+    Args:
+        directory: Directory path
+
+    Yields:
+        os.DirEntry for each file found
+    """
+    subdirectories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        subdirectories.append(entry.path)
+                else:
+                    yield entry
+    except OSError:
+        # Skip directories we can't access
+        return
+
+    for subdirectory in subdirectories:
+        yield from _scan_files(subdirectory)
+
+
 def get_directory_size(directory):
     """
     Calculate total size of a directory.
 
     Demonstrates:
-    - os.walk() for traversing directory tree
+    - os.scandir() recursion for traversing directory tree
     - Calculating cumulative file sizes
     - Working with nested directories
 
@@ -233,17 +372,14 @@ def get_directory_size(directory):
     Returns:
         Total size in bytes
     """
-    directory = Path(directory)
     total_size = 0
 
-    for dirpath, dirnames, filenames in os.walk(directory):
-        for filename in filenames:
-            filepath = Path(dirpath) / filename
-            try:
-                total_size += filepath.stat().st_size
-            except (OSError, FileNotFoundError):
-                # Skip files we can't access
-                pass
+    for entry in _scan_files(directory):
+        try:
+            total_size += entry.stat().st_size
+        except OSError:
+            # Skip files we can't access
+            pass
 
     return total_size
 
@@ -255,7 +391,7 @@ def cleanup_old_backups(backup_dir, keep_count=5):
     Demonstrates:
     - Listing files by modification time
     - Deleting files
-    - os.path operations
+    - Reusing os.DirEntry metadata instead of re-stat'ing
 
     Args:
         backup_dir: Directory containing backups
@@ -264,25 +400,32 @@ def cleanup_old_backups(backup_dir, keep_count=5):
     Returns:
         List of deleted file paths
     """
-    backup_dir = Path(backup_dir)
-
-    if not backup_dir.exists():
+    # Get all backup files sorted by modification time (newest first)
+    # One scandir pass: each DirEntry answers is_file() and stat(), and
+    # only its path string is kept - no Path objects, no second stat
+    try:
+        entries = os.scandir(backup_dir)
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    # Get all backup files sorted by modification time (newest first)
     backup_files = []
-    for file in backup_dir.glob('*_backup_*'):
-        if file.is_file():
-            backup_files.append((file, file.stat().st_mtime))
+    with entries:
+        for entry in entries:
+            if entry.is_file() and fnmatch.fnmatchcase(entry.name, '*_backup_*'):
+                try:
+                    backup_files.append((entry.path, entry.stat().st_mtime))
+                except FileNotFoundError:
+                    # Removed since the directory was listed - nothing to clean up
+                    continue
 
     backup_files.sort(key=lambda x: x[1], reverse=True)
 
     # Delete old backups (keep only keep_count newest)
     deleted = []
-    for file, _ in backup_files[keep_count:]:
-        file.unlink()
-        deleted.append(str(file))
-        log(f"Deleted old backup: {file.name}")
+    for path, _ in backup_files[keep_count:]:
+        os.unlink(path)
+        deleted.append(path)
+        log(f"Deleted old backup: {os.path.basename(path)}")
 
     return deleted
 